@@ -0,0 +1,14 @@
+import pytest
+from toulouse import Deck
+
+
+@pytest.fixture(scope="module")
+def _template_deck():
+    """A sorted italian_40 deck built once per test module."""
+    return Deck.new_deck()
+
+
+@pytest.fixture
+def fresh_deck(_template_deck):
+    """An independent copy of the template deck, safe to mutate."""
+    return _template_deck.copy()
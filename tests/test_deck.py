@@ -1,6 +1,14 @@
+import copy
+import pickle
+import uuid
+import warnings
+import weakref
+
 import pytest
 import numpy as np
-from toulouse import Card, Deck, get_card
+from toulouse import Card, Deck, get_card, get_card_system, register_card_system
+from toulouse.i18n import TRANSLATIONS, get_translation, refresh_translations
+
 
 # --- Test Card Creation and Core Properties ---
 
@@ -17,6 +25,7 @@ def test_card_creation_valid():
     assert arr[0] == 1
     assert arr.shape == (40,)
 
+
 # --- Test String Representations in Multiple Languages ---
 
 def test_card_to_string_languages():
@@ -37,6 +46,7 @@ def test_card_to_string_languages():
     card_es = get_card(value=9, suit=3, card_system_key="spanish_40")
     assert card_es.to_string("es") == "Caballo de Bastos"
 
+
 # --- Test __repr__, Equality, and Hashability ---
 
 def test_card_repr_and_hash():
@@ -47,6 +57,49 @@ def test_card_repr_and_hash():
     assert hash(card1) == hash(card2)
     r = repr(card1)
     assert "value=7" in r and "suit=2" in r
+    other_system = get_card(value=7, suit=2, card_system_key="spanish_40")
+    assert card1 != other_system
+    assert len({card1, card2, other_system}) == 2
+    assert card1 != (7, 2)
+    assert get_card(10, 0) < get_card(1, 1) <= get_card(1, 1)
+    assert get_card(2, 3) > get_card(1, 3)
+    with pytest.raises(TypeError):
+        card1 < (7, 2)
+
+
+def test_get_card_returns_pooled_instance(fresh_deck):
+    """get_card interns cards: equal arguments yield the very same object."""
+    assert get_card(7, 2) is get_card(7, 2)
+    assert get_card(7, 2) is not get_card(7, 2, card_system_key="spanish_40")
+    deck = fresh_deck
+    assert deck[0] is get_card(1, 0)
+
+
+def test_card_from_numpy_scalars_is_hashable():
+    """NumPy integer inputs yield the same hashable pooled card as Python ints."""
+    card = Card(value=np.int64(7), suit=np.int64(2))
+    assert type(card.to_index()) is int
+    assert hash(card) == hash(get_card(7, 2))
+    assert card in {get_card(7, 2)}
+    assert get_card(np.int64(7), np.int64(2)) is get_card(7, 2)
+
+
+def test_cards_and_decks_support_weak_references():
+    """Card and Deck are slotted on every Python yet still accept weak references."""
+    card = get_card(4, 1)
+    assert weakref.ref(card)() is card
+    assert card in weakref.WeakSet([card])
+    deck = Deck()
+    assert weakref.ref(deck)() is deck
+    assert not hasattr(card, "__dict__") and not hasattr(deck, "__dict__")
+
+
+def test_card_copy_and_pickle_keep_pooled_instance():
+    """Copies and unpickled cards resolve back to the pooled instance."""
+    card = get_card(value=5, suit=3)
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
 
 # --- Test Invalid Card Creation ---
 
@@ -61,6 +114,7 @@ def test_card_creation_invalid_suit():
     with pytest.raises(ValueError):
         Card(value=2, suit=44)
 
+
 # --- Test Deck Functionality ---
 
 def test_deck_creation_and_reset():
@@ -73,6 +127,79 @@ def test_deck_creation_and_reset():
     deck.reset()
     assert len(deck) == 40
 
+
+def test_deck_draw_many_deals_in_order(fresh_deck):
+    """draw_many matches consecutive draws and keeps the state in sync."""
+    deck = fresh_deck
+    expected = deck.copy()
+    assert deck.state.sum() == 40
+    hands = deck.draw_many([3, 3, 3, 3])
+    assert hands == [expected.draw(3) for _ in range(4)]
+    assert len(deck) == 28
+    assert np.array_equal(deck.state, expected.state)
+    assert [len(hand) for hand in deck.draw_many([20, 20, 5])] == [20, 8, 0]
+    assert deck.state_bits == 0
+
+
+def test_deck_shuffle_and_sort(fresh_deck):
+    """Shuffling keeps the same cards; sorting restores index order."""
+    deck = fresh_deck
+    deck.shuffle()
+    assert len(deck) == 40
+    assert deck.state.sum() == 40
+    deck.draw(3)
+    deck.sort()
+    indices = [card.to_index() for card in deck]
+    assert indices == sorted(indices)
+    assert len(indices) == 37
+
+    # sort only reorders: it never drops or replaces cards
+    twice = Deck.from_cards([get_card(2, 0), get_card(2, 0)])
+    twice.sort()
+    assert len(twice) == 2
+
+
+def test_deck_seed_makes_shuffle_reproducible():
+    """Reseeding the shared generator replays the same shuffle."""
+    orders = []
+    for _ in range(2):
+        Deck.seed(1234)
+        deck = Deck.new_deck(sorted_deck=False)
+        orders.append([card.to_index() for card in deck])
+    Deck.seed()
+    assert orders[0] == orders[1]
+    assert orders[0] != list(range(40))
+
+
+def test_deck_shuffle_batch_keeps_contents():
+    """Batch shuffling permutes each deck independently of its length."""
+    decks = [Deck.new_deck(), Deck.from_cards([get_card(1, 0), get_card(2, 0)]), Deck()]
+    before = [deck.state for deck in decks]
+    Deck.shuffle_batch(decks)
+    assert [len(deck) for deck in decks] == [40, 2, 0]
+    for deck, state in zip(decks, before):
+        assert np.array_equal(deck.state, state)
+    Deck.shuffle_batch([])
+
+
+def test_deck_append_duplicate_card():
+    """Appending a card already in the deck should raise ValueError."""
+    deck = Deck.from_cards([get_card(1, 0)])
+    with pytest.raises(ValueError):
+        deck.append(get_card(1, 0))
+    assert len(deck) == 1
+    deck.append(get_card(2, 0))
+    assert len(deck) == 2
+    spanish = get_card(3, 1, card_system_key="spanish_40")
+    with pytest.raises(ValueError):
+        deck.append(spanish)
+    with pytest.raises(ValueError):
+        Deck.from_cards([get_card(1, 0), spanish])
+    with pytest.raises(ValueError):
+        Deck(_cards=[spanish])
+    assert list(Deck.from_cards([spanish], card_system_key="spanish_40")) == [spanish]
+
+
 def test_deck_pretty_print_languages():
     """Check the pretty_print output in different languages."""
     cards = [get_card(1, 0), get_card(2, 0), get_card(1, 1)]
@@ -84,4 +211,242 @@ def test_deck_pretty_print_languages():
     deck_en = Deck.from_cards(cards, language="en")
     output_en = deck_en.pretty_print()
     assert "Coins: Ace of Coins, Two of Coins" in output_en
-    assert "Cups: Ace of Cups" in output_en
\ No newline at end of file
+    assert "Cups: Ace of Cups" in output_en
+    assert "Ace of Coins" in repr(deck_en)
+
+    deck_it = Deck.from_cards([get_card(3, 3), get_card(1, 3), get_card(2, 1)])
+    assert deck_it.pretty_print().splitlines() == [
+        "Denari: ",
+        "Coppe: Due di Coppe",
+        "Spade: ",
+        "Bastoni: Asso di Bastoni, Tre di Bastoni",
+    ]
+
+
+def test_card_deck_soa_matches_cards(fresh_deck):
+    """deck_soa exposes the whole system as parallel read-only arrays."""
+    values, suits, states = Card.deck_soa()
+    assert values.tolist() == fresh_deck.values.tolist()
+    assert suits.tolist() == fresh_deck.suits.tolist()
+    assert np.array_equal(states, fresh_deck.card_states)
+    assert not states.flags.writeable
+    assert values.dtype == suits.dtype == np.int64
+    assert states.dtype == np.uint8
+
+
+def test_card_state_is_shared_and_read_only():
+    """Card states are views into a shared table and cannot be mutated."""
+    card = get_card(value=3, suit=1)
+    assert card.state.base is get_card(value=4, suit=2).state.base
+    assert card.state[card.to_index()] == 1
+    with pytest.raises(ValueError):
+        card.state[0] = 1
+
+
+def test_state_vectors_use_narrow_dtype(fresh_deck):
+    """Card and Deck states share a one-byte dtype."""
+    deck = fresh_deck
+    assert deck.state.dtype == np.uint8
+    assert deck[0].state.dtype == np.uint8
+    assert deck.state.sum() == 40
+
+
+def test_deck_state_bits_matches_state():
+    """The integer bitset and the numpy state describe the same cards."""
+    cards = [get_card(1, 0), get_card(10, 3), get_card(5, 2)]
+    deck = Deck.from_cards(cards)
+    bits = deck.state_bits
+    assert bits == sum(1 << card.to_index() for card in cards)
+    assert bits == get_card(1, 0).to_bits() | get_card(10, 3).to_bits() | get_card(5, 2).to_bits()
+    assert bits & get_card(2, 0).to_bits() == 0
+    state = deck.state
+    assert state.sum() == 3
+    for card in cards:
+        assert (bits >> card.to_index()) & 1
+        assert state[card.to_index()] == 1
+
+
+def test_deck_mask_stays_python_int_for_numpy_cards():
+    """Cards built from NumPy scalars keep the deck bitmask a Python int."""
+    cards = [Card(value=np.int64(v), suit=np.int64(1)) for v in (1, 5, 9)]
+    deck = Deck.from_cards(cards[:2])
+    deck.append(cards[2])
+    assert type(deck.state_bits) is int
+    assert np.array_equal(deck.to_packed(), np.packbits(deck.state, bitorder="little"))
+    assert Deck.batch_packed([deck]).shape == (1, 5)
+    deck.draw(1)
+    assert type(deck.state_bits) is int
+
+
+def test_deck_from_bits_round_trip():
+    """Decoding a bitset yields the same cards, sorted by index."""
+    cards = [get_card(10, 3), get_card(1, 0), get_card(5, 2)]
+    deck = Deck.from_bits(Deck.from_cards(cards).state_bits)
+    assert list(deck) == sorted(cards)
+    assert len(Deck.from_bits(0)) == 0
+    assert len(Deck.from_bits((1 << 40) - 1)) == 40
+    with pytest.raises(ValueError):
+        Deck.from_bits(1 << 40)
+    assert list(Deck.from_bits(np.uint64(5))) == [get_card(1, 0), get_card(3, 0)]
+    assert len(Deck.from_bits(np.int64((1 << 40) - 1))) == 40
+    with pytest.raises(TypeError):
+        Deck.from_bits(5.0)
+
+
+def test_deck_packed_round_trip():
+    """Packed bits match np.packbits of the state and decode to the same cards."""
+    cards = [get_card(10, 3), get_card(1, 0), get_card(5, 2)]
+    deck = Deck.from_cards(cards)
+    packed = deck.to_packed()
+    assert packed.dtype == np.uint8 and packed.shape == (5,)
+    assert np.array_equal(packed, np.packbits(deck.state, bitorder="little"))
+    assert list(Deck.from_packed(packed)) == sorted(cards)
+    assert len(Deck.from_packed(Deck().to_packed())) == 0
+    with pytest.raises(ValueError):
+        Deck.from_packed(np.zeros(4, dtype=np.uint8))
+
+
+def test_deck_from_state_round_trip():
+    """A deck rebuilt from its state vector holds the same cards."""
+    cards = [get_card(1, 0), get_card(7, 1), get_card(10, 3)]
+    deck = Deck.from_state(Deck.from_cards(cards).state, language="en")
+    assert len(deck) == 3
+    assert deck.language == "en"
+    assert all(card in deck for card in cards)
+    assert get_card(2, 0) not in deck
+    assert get_card(1, 0, card_system_key="spanish_40") not in deck
+    assert "Asso di Denari" not in deck
+    assert np.array_equal(deck.state, Deck.from_cards(cards).state)
+
+    with pytest.raises(ValueError):
+        Deck.from_state(np.zeros(39, dtype=np.uint8))
+
+
+def test_language_fallback_warns_once():
+    """Unknown languages fall back to English with a single warning."""
+    card = get_card(value=1, suit=1)
+    with pytest.warns(UserWarning, match="'de'"):
+        assert card.to_string("de") == "Ace of Cups"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert get_card(value=2, suit=1).to_string("de") == "Two of Cups"
+
+
+def test_language_fallback_warning_points_at_caller():
+    """The fallback warning is attributed to user code, whatever the entry point."""
+    with pytest.warns(UserWarning) as record:
+        str_of_card = get_card(value=3, suit=1).to_string("xx")
+        Deck.from_cards([get_card(3, 1)], language="yy").pretty_print()
+        repr(Deck.from_cards([get_card(4, 1)], language="zz"))
+    assert str_of_card == "Three of Cups"
+    assert [w.filename for w in record] == [__file__] * 3
+
+
+def test_refresh_translations_picks_up_new_language():
+    """Languages added at runtime are served once translations are refreshed."""
+    card = get_card(value=1, suit=0)
+    with pytest.warns(UserWarning, match="'pt'"):
+        assert card.to_string("pt") == "Ace of Coins"
+    TRANSLATIONS["pt"] = {
+        "suits": {"italian_40": ["Ouros", "Copas", "Espadas", "Paus"]},
+        "values": {"italian_40": {1: "Ás"}},
+        "connectors": {"of": "de"},
+    }
+    try:
+        assert get_translation("pt", "italian_40")["connector"] == "de"
+        refresh_translations()
+        assert card.to_string("pt") == "Ás de Ouros"
+    finally:
+        del TRANSLATIONS["pt"]
+        refresh_translations()
+    assert get_translation("pt", "italian_40") is get_translation("en", "italian_40")
+
+
+def test_registered_system_with_sparse_values():
+    """Non-contiguous values still map to distinct, dense indices."""
+    # Systems are process-global: a fresh key keeps reruns from colliding
+    key = f"test_sparse_8_{uuid.uuid4().hex}"
+    register_card_system(key, {
+        "suits": ["A", "B"],
+        "values": [1, 7, 8, 13],
+        "deck_size": 8,
+    })
+    deck = Deck.new_deck(card_system_key=key)
+    assert [card.to_index() for card in deck] == list(range(8))
+    assert deck.state.sum() == 8
+    assert get_card(13, 1, card_system_key=key).to_index() == 7
+    with pytest.raises(ValueError):
+        Card(value=2, suit=0, card_system_key=key)
+    with pytest.raises(ValueError):
+        register_card_system(key + "_bad", {"suits": ["A", "B"], "values": [1, 2], "deck_size": 3})
+    with pytest.raises(KeyError):
+        get_card_system(key + "_bad")
+
+
+def test_deck_array_views():
+    """indices/values/suits expose the deck as parallel integer arrays."""
+    cards = [get_card(10, 3), get_card(1, 0), get_card(5, 2)]
+    deck = Deck.from_cards(cards)
+    assert deck.indices.tolist() == [card.to_index() for card in cards]
+    assert deck.values.tolist() == [10, 1, 5]
+    assert deck.suits.tolist() == [3, 0, 2]
+    assert Deck().indices.shape == (0,)
+    states = deck.card_states
+    assert states.shape == (3, 40)
+    assert np.array_equal(states, np.stack([card.state for card in cards]))
+    assert np.array_equal(states.sum(axis=0), deck.state)
+
+
+def test_card_systems_are_read_only():
+    """Registered systems cannot be mutated through get_card_system."""
+    system = get_card_system("italian_40")
+    assert system["deck_size"] == 40
+    assert system["values"] == tuple(range(1, 11))
+    with pytest.raises(TypeError):
+        system["deck_size"] = 52
+
+
+def test_deck_state_tracks_mutations(fresh_deck):
+    """The cached state stays correct across draw/remove/append."""
+    deck = fresh_deck
+    assert deck.state.sum() == 40
+    drawn = deck.draw(3)
+    card = deck[0]
+    deck.remove(card)
+    expected = np.ones(40, dtype=np.uint8)
+    expected[[c.to_index() for c in drawn + [card]]] = 0
+    assert np.array_equal(deck.state, expected)
+    with pytest.raises(ValueError):
+        deck.remove(card)
+    deck.append(card)
+    expected[card.to_index()] = 1
+    assert np.array_equal(deck.state, expected)
+    deck.shuffle()
+    assert np.array_equal(deck.state, expected)
+    deck.sort()
+    assert np.array_equal(deck.state, expected)
+    twin = deck.copy()
+    twin.draw(5)
+    assert np.array_equal(deck.state, expected)
+    deck.reset()
+    assert deck.state.sum() == 40
+    assert np.array_equal(deck.state, Deck.from_cards(list(deck)).state)
+
+
+def test_deck_batch_state(fresh_deck):
+    """batch_state matches stacking each deck's own state."""
+    decks = [fresh_deck, Deck.from_cards([get_card(3, 1)]), Deck()]
+    batch = Deck.batch_state(decks)
+    assert batch.shape == (3, 40)
+    assert batch.dtype == np.uint8
+    assert np.array_equal(batch, np.stack([deck.state for deck in decks]))
+    with pytest.raises(ValueError):
+        Deck.batch_state([fresh_deck, Deck(card_system_key="spanish_40")])
+    with pytest.raises(ValueError):
+        Deck.batch_state([])
+    packed = Deck.batch_packed(decks)
+    assert packed.shape == (3, 5)
+    assert np.array_equal(packed, np.packbits(batch, axis=1, bitorder="little"))
+    assert np.array_equal(packed[1], decks[1].to_packed())
+    with pytest.raises(ValueError):
+        Deck.batch_packed([])
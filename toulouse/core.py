@@ -2,12 +2,13 @@
 Toulouse - High-Performance Card Game Library for Reinforcement Learning
 
 A modern, high-performance card library for RL/MCTS applications.
-- Uses dataclasses for Card (no Pydantic)
+- Uses slotted dataclasses for Card and Deck (no Pydantic, weak references still supported), with the card index cached at creation
 - Object pooling for Card instances
-- O(1) set-based search in Deck
-- Cached numpy state generation
+- O(1) bitmask-based search in Deck
+- Cached numpy state generation, patched in place on single-card moves
+- Shared read-only one-hot tables for Card states
 - Lazy loading of card names by language
-- LRU cache for card system configs
+- Read-only card system registry, plus per-system lookup tables for hot paths
 - Pre-allocated numpy buffers for state vectors
 
 Usage:
@@ -19,33 +20,45 @@ Usage:
     state = deck.state
 """
 
-import random
+import operator
 import numpy as np
-from typing import Any, Iterator, Optional, Dict, List, Set
-from dataclasses import dataclass, field
-from functools import lru_cache
-import weakref
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, NamedTuple, Optional, Dict, List
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, total_ordering
 from toulouse.i18n import get_translation
 
+# Shared random generator for deck shuffling
+_RNG = np.random.default_rng()
+
+def _freeze_system(config: Mapping[str, Any]) -> Mapping[str, Any]:
+    # Card systems are shared by every card and deck: store them read-only
+    frozen = dict(config)
+    frozen["suits"] = tuple(frozen["suits"])
+    frozen["values"] = tuple(frozen["values"])
+    return MappingProxyType(frozen)
+
+
 # Card system configurations
-_CARD_SYSTEMS: Dict[str, Dict[str, Any]] = {
-    "italian_40": {
-        "suits": ["Denari", "Coppe", "Spade", "Bastoni"],
-        "values": list(range(1, 11)),
+_CARD_SYSTEMS: Dict[str, Mapping[str, Any]] = {
+    "italian_40": _freeze_system({
+        "suits": ("Denari", "Coppe", "Spade", "Bastoni"),
+        "values": tuple(range(1, 11)),
         "deck_size": 40,
-    },
-    "spanish_40": {
-        "suits": ["Oros", "Copas", "Espadas", "Bastos"],
-        "values": list(range(1, 11)),
+    }),
+    "spanish_40": _freeze_system({
+        "suits": ("Oros", "Copas", "Espadas", "Bastos"),
+        "values": tuple(range(1, 11)),
         "deck_size": 40,
-    },
+    }),
 }
 
-@lru_cache(maxsize=32)
-def get_card_system(key: str) -> Dict[str, Any]:
-    if key not in _CARD_SYSTEMS:
+def get_card_system(key: str) -> Mapping[str, Any]:
+    # Systems are already frozen mappings: a plain dict lookup is all we need
+    system = _CARD_SYSTEMS.get(key)
+    if system is None:
         raise KeyError(f"Card system '{key}' is not registered.")
-    return _CARD_SYSTEMS[key]
+    return system
 
 
 def register_card_system(key: str, config: Dict[str, Any]):
@@ -54,75 +67,240 @@ def register_card_system(key: str, config: Dict[str, Any]):
     for req in ["suits", "values", "deck_size"]:
         if req not in config:
             raise ValueError(f"Missing '{req}' in card system config.")
-    _CARD_SYSTEMS[key] = config.copy()
+    # Card indices, lookup tables and packed states all assume one slot per (suit, value)
+    n_cards = len(config["suits"]) * len(config["values"])
+    if config["deck_size"] != n_cards:
+        raise ValueError(
+            f"deck_size {config['deck_size']} does not match {len(config['suits'])} suits "
+            f"x {len(config['values'])} values = {n_cards} cards."
+        )
+    _CARD_SYSTEMS[key] = _freeze_system(config)
+    _build_lookup_tables(key)
+
+
+# Narrow integer dtype shared by every Card and Deck state vector
+_STATE_DTYPE = np.uint8
+
+class _SystemTables(NamedTuple):
+    """Lookup data derived once per registered card system."""
+    system_id: int  # small integer folded into each Card's identity key
+    deck_size: int
+    n_suits: int
+    n_values: int
+    suits: tuple
+    values: tuple
+    value_index: Dict[int, int]  # value -> position within its suit
+    state_table: np.ndarray  # row i is the one-hot state of card index i
+    index_values: np.ndarray  # card index -> value
+    index_suits: np.ndarray  # card index -> suit
+
+
+_SYSTEM_TABLES: Dict[str, _SystemTables] = {}
+
+
+def _build_lookup_tables(key: str):
+    system = _CARD_SYSTEMS[key]
+    values = system["values"]
+    n_values, n_suits = len(values), len(system["suits"])
+    state_table = np.eye(system["deck_size"], dtype=_STATE_DTYPE)
+    index_values = np.tile(np.asarray(values, dtype=np.int64), n_suits)
+    index_suits = np.repeat(np.arange(n_suits, dtype=np.int64), n_values)
+    for arr in (state_table, index_values, index_suits):
+        arr.setflags(write=False)
+    _SYSTEM_TABLES[key] = _SystemTables(
+        system_id=len(_SYSTEM_TABLES),
+        deck_size=system["deck_size"],
+        n_suits=n_suits,
+        n_values=n_values,
+        suits=system["suits"],
+        values=values,
+        value_index={v: i for i, v in enumerate(values)},
+        state_table=state_table,
+        index_values=index_values,
+        index_suits=index_suits,
+    )
+
+
+def _system_tables(key: str) -> _SystemTables:
+    tables = _SYSTEM_TABLES.get(key)
+    if tables is None:
+        raise KeyError(f"Card system '{key}' is not registered.")
+    return tables
 
 
-# Object pooling for Card instances
+for _key in _CARD_SYSTEMS:
+    _build_lookup_tables(_key)
+
+
+# Object pooling for Card instances (flyweights: one instance per distinct card)
 _CARD_POOL: Dict[tuple, "Card"] = {}
-_CARD_POOL_CLEANUP = weakref.WeakSet()
 
 
 def get_card(value: int, suit: int, card_system_key: str = "italian_40") -> "Card":
     key = (value, suit, card_system_key)
-    if key not in _CARD_POOL:
-        _CARD_POOL[key] = Card(value=value, suit=suit, card_system_key=card_system_key)
-        _CARD_POOL_CLEANUP.add(_CARD_POOL[key])
-    return _CARD_POOL[key]
-
-
-@dataclass(frozen=True)
+    card = _CARD_POOL.get(key)
+    if card is None:
+        card = _CARD_POOL[key] = Card(value=value, suit=suit, card_system_key=card_system_key)
+    return card
+
+
+# Per-system tuples of every pooled card, ordered by card index
+_CARD_TABLES: Dict[str, tuple] = {}
+
+
+def _card_table(card_system_key: str) -> tuple:
+    table = _CARD_TABLES.get(card_system_key)
+    if table is None:
+        tables = _system_tables(card_system_key)
+        table = _CARD_TABLES[card_system_key] = tuple(
+            get_card(value=v, suit=s, card_system_key=card_system_key)
+            for s in range(tables.n_suits)
+            for v in tables.values
+        )
+    return table
+
+
+@lru_cache(maxsize=4096)
+def _card_name(value: int, suit: int, card_system_key: str, language: str) -> str:
+    # Card names are pure functions of their inputs: format each one only once
+    # Called straight from public Card/Deck methods (lru_cache adds no Python frame):
+    # get_translation -> _card_name -> public method -> user code. pretty_print
+    # resolves (and warns) itself before formatting any name.
+    translations = get_translation(language, card_system_key, stacklevel=4)
+    value_str = translations["values"].get(value, str(value))
+    suit_str = translations["suits"][suit]
+    connector = translations["connector"]
+    return f"{value_str} {connector} {suit_str}"
+
+
+def _with_slots(cls):
+    # Rebuild a dataclass with __slots__ for its fields plus __weakref__. Unlike
+    # dataclass(slots=True, weakref_slot=True) (3.11+), this works on every supported Python.
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names + ("__weakref__",)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@total_ordering
+@_with_slots
+@dataclass(frozen=True, eq=False)
 class Card:
     value: int
     suit: int
     card_system_key: str = "italian_40"
+    _index: int = field(init=False, repr=False)
+    _key: int = field(init=False, repr=False)
+    _state: np.ndarray = field(init=False, repr=False)
 
     def __post_init__(self):
-        system = get_card_system(self.card_system_key)
-        if self.value not in system["values"]:
-            raise ValueError(f"Value {self.value} not in allowed values: {system['values']}")
-        if not (0 <= self.suit < len(system["suits"])):
-            raise ValueError(f"Suit {self.suit} out of range for system suits: {system['suits']}")
+        tables = _system_tables(self.card_system_key)
+        value_index = tables.value_index.get(self.value)
+        if value_index is None:
+            raise ValueError(f"Value {self.value} not in allowed values: {tables.values}")
+        if not (0 <= self.suit < tables.n_suits):
+            raise ValueError(f"Suit {self.suit} out of range for system suits: {tables.suits}")
+        # Cards are immutable: compute the index and state view once
+        # int() so NumPy scalar inputs still give Python-int indices, keys and masks
+        index = int(self.suit * tables.n_values + value_index)
+        object.__setattr__(self, "_index", index)
+        # (system, index) packed in one int: equality and hashing are a single int op
+        object.__setattr__(self, "_key", (tables.system_id << 32) | index)
+        object.__setattr__(self, "_state", tables.state_table[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other: object) -> bool:
+        # _key orders by system, then by index (suit, then value)
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self._key < other._key
+
+    def __hash__(self) -> int:
+        return self._key
+
+    def __reduce__(self):
+        # Unpickling and deep copies resolve back to the pooled instance
+        return get_card, (self.value, self.suit, self.card_system_key)
 
     def to_index(self) -> int:
-        system = get_card_system(self.card_system_key)
-        return self.suit * len(system["values"]) + (self.value - min(system["values"]))
+        return self._index
+
+    def to_bits(self) -> int:
+        """Single-bit mask of the card, compatible with Deck.state_bits."""
+        return 1 << self._index
 
     @property
     def state(self) -> np.ndarray:
-        system = get_card_system(self.card_system_key)
-        arr = np.zeros(system["deck_size"], dtype=np.uint8)
-        arr[self.to_index()] = 1
-        return arr
+        """One-hot vector of the card, as a read-only view into the shared state table."""
+        return self._state
+
+    @staticmethod
+    def deck_soa(card_system_key: str = "italian_40"):
+        """Return (values, suits, states) for every card of a system, in index order.
+
+        The arrays are the shared read-only lookup tables; no copy is made. values and
+        suits are int64 rather than uint8, since registered systems may use any
+        integer card values; states are uint8.
+        """
+        tables = _system_tables(card_system_key)
+        return tables.index_values, tables.index_suits, tables.state_table
 
     def to_string(self, language: str = "it") -> str:
-        translations = get_translation(language, self.card_system_key)
-        value_str = translations["values"].get(self.value, str(self.value))
-        suit_str = translations["suits"][self.suit]
-        connector = translations["connector"]
-        return f"{value_str} {connector} {suit_str}"
+        return _card_name(self.value, self.suit, self.card_system_key, language)
 
     def __str__(self) -> str:
-        return self.to_string()
+        return _card_name(self.value, self.suit, self.card_system_key, "it")
 
     def __repr__(self) -> str:
         return f"Card(value={self.value}, suit={self.suit}, system='{self.card_system_key}')"
 
 
+def _cards_mask(cards) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card._index
+    return mask
+
+
+def _bit_indices(bits: int) -> List[int]:
+    # Visit only the set bits, lowest index first
+    indices = []
+    while bits:
+        low = bits & -bits
+        indices.append(low.bit_length() - 1)
+        bits ^= low
+    return indices
+
+
+@_with_slots
 @dataclass
 class Deck:
     card_system_key: str = "italian_40"
     language: str = "it"
     _cards: List[Card] = field(default_factory=list)
-    _card_set: Set[Card] = field(default_factory=set)
-    _state_cache: Optional[np.ndarray] = None
-    _state_dirty: bool = True
+    _mask: int = 0  # bit i is set when the card of index i is in the deck
+    _state_cache: Optional[np.ndarray] = None  # always in sync with the deck contents
     _deck_size: int = 40
 
     def __post_init__(self):
-        system = get_card_system(self.card_system_key)
-        self._deck_size = system["deck_size"]
+        self._deck_size = _system_tables(self.card_system_key).deck_size
         if self._cards:
-            self._card_set = set(self._cards)
+            # The mask is indexed per system: cards from another system cannot be tracked
+            for card in self._cards:
+                if card.card_system_key != self.card_system_key:
+                    raise self._system_error(card)
+            self._mask = _cards_mask(self._cards)
+        if self._state_cache is None:
+            self._state_cache = np.zeros(self._deck_size, dtype=_STATE_DTYPE)
+            if self._cards:
+                self._state_cache[self.indices] = 1
 
     def __len__(self) -> int:
         return len(self._cards)
@@ -133,79 +311,202 @@ class Deck:
     def __getitem__(self, idx):
         return self._cards[idx]
 
+    def __contains__(self, card: object) -> bool:
+        return (
+            isinstance(card, Card)
+            and card.card_system_key == self.card_system_key
+            and bool(self._mask >> card._index & 1)
+        )
+
     def __str__(self) -> str:
         return f"Deck of {len(self._cards)} cards ({self.card_system_key})"
 
     def __repr__(self) -> str:
-        preview = ", ".join([str(card) for card in self._cards[:4]])
+        # Plain loop, not a comprehension: keeps _card_name one frame below a public method
+        names = []
+        for card in self._cards[:4]:
+            names.append(_card_name(card.value, card.suit, card.card_system_key, self.language))
+        preview = ", ".join(names)
         return f"Deck(cards=[{preview}, ...], system='{self.card_system_key}')"
 
     def pretty_print(self) -> str:
-        translations = get_translation(self.language, self.card_system_key)
+        translations = get_translation(self.language, self.card_system_key, stacklevel=3)
+        # Bucket cards by suit in a single pass
+        buckets: List[List[Card]] = [[] for _ in range(_SYSTEM_TABLES[self.card_system_key].n_suits)]
+        for card in self._cards:
+            buckets[card.suit].append(card)
         lines = []
-        for suit_idx, suit_name in enumerate(translations["suits"]):
-            # Filter cards for the current suit and sort them by value
-            suit_cards = sorted(
-                [card for card in self._cards if card.suit == suit_idx],
-                key=lambda c: c.value
-            )
+        for suit_name, suit_cards in zip(translations["suits"], buckets):
+            suit_cards.sort(key=operator.attrgetter("value"))
             # Get translated card names
             card_names = [card.to_string(self.language) for card in suit_cards]
             lines.append(f"{suit_name}: {', '.join(card_names)}")
         return "\n".join(lines)
 
     def draw(self, n: int = 1) -> List[Card]:
-        n = max(0, min(n, len(self._cards)))
-        drawn = self._cards[:n]
-        self._cards = self._cards[n:]
+        cards = self._cards
+        n = max(0, min(n, len(cards)))
+        drawn = cards[:n]
+        # One memmove of the remaining pointers; no new list for the rest of the deck
+        del cards[:n]
+        mask = self._mask
         for card in drawn:
-            self._card_set.discard(card)
-        self._state_dirty = True
+            mask &= ~(1 << card._index)
+        self._mask = mask
+        self._patch_state([card._index for card in drawn], 0)
         return drawn
 
+    def draw_many(self, counts: List[int]) -> List[List[Card]]:
+        """Deals consecutive hands of the given sizes from the top of the deck in one pass."""
+        cards = self._cards
+        hands = []
+        start = 0
+        for n in counts:
+            end = start + max(0, min(n, len(cards) - start))
+            hands.append(cards[start:end])
+            start = end
+        drawn = cards[:start]
+        del cards[:start]
+        self._mask &= ~_cards_mask(drawn)
+        self._patch_state([card._index for card in drawn], 0)
+        return hands
+
     def shuffle(self):
-        random.shuffle(self._cards)
-        self._state_dirty = True
+        order = _RNG.permutation(len(self._cards)).tolist()
+        cards = self._cards
+        # Reordering leaves the composition, and so the state cache, unchanged
+        self._cards = [cards[i] for i in order]
+
+    @staticmethod
+    def shuffle_batch(decks: List["Deck"]):
+        """Shuffles many decks at once from a single batch of random sort keys."""
+        if not decks:
+            return
+        lengths = np.array([len(deck) for deck in decks])
+        keys = _RNG.random((len(decks), int(lengths.max())))
+        # Padding slots of shorter decks sort after every real card
+        keys[np.arange(keys.shape[1]) >= lengths[:, None]] = 2.0
+        for deck, order in zip(decks, np.argsort(keys, axis=1).tolist()):
+            cards = deck._cards
+            deck._cards = [cards[i] for i in order[:len(cards)]]
+
+    @staticmethod
+    def batch_state(decks: List["Deck"]) -> np.ndarray:
+        """Stacks the states of same-system decks into one (n_decks, deck_size) matrix."""
+        Deck._check_batch(decks, "batch_state")
+        # COO-style build: one scatter of every (deck, card index) pair
+        rows = np.repeat(np.arange(len(decks)), [len(deck) for deck in decks])
+        cols = np.concatenate([deck.indices for deck in decks])
+        out = np.zeros((len(decks), decks[0]._deck_size), dtype=_STATE_DTYPE)
+        out[rows, cols] = 1
+        return out
+
+    @staticmethod
+    def batch_packed(decks: List["Deck"]) -> np.ndarray:
+        """Stacks the packed bits of same-system decks into one (n_decks, ceil(deck_size / 8)) matrix."""
+        Deck._check_batch(decks, "batch_packed")
+        n_bytes = (decks[0]._deck_size + 7) // 8
+        # Serialise every bitmask straight into one buffer: no one-hot states are built
+        raw = b"".join([deck._mask.to_bytes(n_bytes, "little") for deck in decks])
+        return np.frombuffer(raw, dtype=np.uint8).reshape(len(decks), n_bytes).copy()
+
+    @staticmethod
+    def _check_batch(decks: List["Deck"], name: str):
+        if not decks:
+            raise ValueError(f"{name} needs at least one deck.")
+        key = decks[0].card_system_key
+        if any(deck.card_system_key != key for deck in decks):
+            raise ValueError("All decks in a batch must share the same card system.")
+
+    @staticmethod
+    def seed(seed: Optional[int] = None):
+        """Reseeds the random generator shared by every Deck.shuffle call."""
+        global _RNG
+        _RNG = np.random.default_rng(seed)
 
     def sort(self):
-        self._cards.sort(key=lambda c: c.to_index())
-        self._state_dirty = True
+        # Pure reorder by the cached index: the deck keeps exactly the cards it holds
+        self._cards.sort(key=operator.attrgetter("_index"))
 
     def append(self, card: Card):
         if card.card_system_key != self.card_system_key:
-            raise ValueError(
-                f"Cannot add card from system '{card.card_system_key}' to '{self.card_system_key}' deck."
-            )
+            raise self._system_error(card)
+        bit = 1 << card._index
+        if self._mask & bit:
+            raise ValueError(f"Card {card!r} is already in the deck.")
         self._cards.append(card)
-        self._card_set.add(card)
-        self._state_dirty = True
+        self._mask |= bit
+        self._patch_state(card._index, 1)
+
+    def _system_error(self, card: Card) -> ValueError:
+        return ValueError(
+            f"Cannot add card from system '{card.card_system_key}' to '{self.card_system_key}' deck."
+        )
 
     def remove(self, card: Card):
+        # Bit test first: a missing card fails without scanning the list
+        if card not in self:
+            raise ValueError(f"Card {card!r} is not in the deck.")
         self._cards.remove(card)
-        self._card_set.discard(card)
-        self._state_dirty = True
+        self._mask &= ~(1 << card._index)
+        self._patch_state(card._index, 0)
+
+    def _patch_state(self, indices, value: int):
+        # Single-card moves update the cache in place instead of rebuilding it
+        self._state_cache[indices] = value
 
     def contains(self, card: Card) -> bool:
-        return card in self._card_set
+        return card in self
 
     def reset(self):
-        system = get_card_system(self.card_system_key)
-        self._cards = [
-            get_card(value=v, suit=s, card_system_key=self.card_system_key)
-            for s in range(len(system["suits"]))
-            for v in system["values"]
-        ]
-        self._card_set = set(self._cards)
-        self._state_dirty = True
+        self._cards = list(_card_table(self.card_system_key))
+        self._mask = (1 << len(self._cards)) - 1
+        # Reuse the buffer owned by this deck rather than reallocating it
+        self._state_cache.fill(0)
+        self._state_cache[self.indices] = 1
+
+    @property
+    def state_bits(self) -> int:
+        """Deck composition as an integer bitset: bit i is set when card index i is present."""
+        return self._mask
+
+    def to_packed(self) -> np.ndarray:
+        """Deck composition as packed bits: a uint8 array of ceil(deck_size / 8) bytes.
+
+        Bits are little-endian, so bit i of the packed array is card index i, as in
+        state_bits and np.unpackbits(packed, bitorder="little").
+        """
+        n_bytes = (self._deck_size + 7) // 8
+        return np.frombuffer(self._mask.to_bytes(n_bytes, "little"), dtype=np.uint8).copy()
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Card indices in deck order, as an integer array."""
+        cards = self._cards
+        return np.fromiter([card._index for card in cards], dtype=np.intp, count=len(cards))
+
+    @property
+    def values(self) -> np.ndarray:
+        """Card values in deck order, as an integer array."""
+        return _SYSTEM_TABLES[self.card_system_key].index_values[self.indices]
+
+    @property
+    def suits(self) -> np.ndarray:
+        """Card suits in deck order, as an integer array."""
+        return _SYSTEM_TABLES[self.card_system_key].index_suits[self.indices]
+
+    @property
+    def card_states(self) -> np.ndarray:
+        """One-hot state of every card in deck order, as an (n_cards, deck_size) matrix."""
+        return _SYSTEM_TABLES[self.card_system_key].state_table[self.indices]
 
     @property
     def state(self) -> np.ndarray:
-        if self._state_dirty or self._state_cache is None:
-            arr = np.zeros(self._deck_size, dtype=np.uint8)
-            for card in self._cards:
-                arr[card.to_index()] = 1
-            self._state_cache = arr
-            self._state_dirty = False
+        """One-hot composition of the deck.
+
+        Returned as a copy so callers can keep or mutate it: a view of the cache
+        would silently change on the next draw/append/remove.
+        """
         return self._state_cache.copy()
 
     def move_card_to(self, card: Card, other_deck: "Deck"):
@@ -232,21 +533,67 @@ class Deck:
         card_system_key: str = "italian_40",
         language: str = "it",
     ) -> "Deck":
-        deck = cls(card_system_key=card_system_key, language=language)
-        deck._cards = list(cards)
-        deck._card_set = set(cards)
-        deck._state_dirty = True
-        return deck
+        # __post_init__ checks the card systems and builds the membership mask
+        return cls(card_system_key=card_system_key, language=language, _cards=list(cards))
+
+    @classmethod
+    def from_state(
+        cls,
+        state: np.ndarray,
+        card_system_key: str = "italian_40",
+        language: str = "it",
+    ) -> "Deck":
+        state = np.asarray(state)
+        deck_size = _system_tables(card_system_key).deck_size
+        if state.shape != (deck_size,):
+            raise ValueError(
+                f"State of shape {state.shape} does not match deck size {deck_size} of '{card_system_key}'."
+            )
+        table = _card_table(card_system_key)
+        cards = [table[i] for i in np.flatnonzero(state).tolist()]
+        return cls.from_cards(cards, card_system_key=card_system_key, language=language)
+
+    @classmethod
+    def from_bits(
+        cls,
+        bits: int,
+        card_system_key: str = "italian_40",
+        language: str = "it",
+    ) -> "Deck":
+        # Accept NumPy integer scalars (e.g. np.uint64) but work on a Python int
+        bits = operator.index(bits)
+        table = _card_table(card_system_key)
+        if bits < 0 or bits >> len(table):
+            raise ValueError(f"Bitset {bits:#x} has bits outside the '{card_system_key}' deck.")
+        cards = [table[i] for i in _bit_indices(bits)]
+        return cls.from_cards(cards, card_system_key=card_system_key, language=language)
+
+    @classmethod
+    def from_packed(
+        cls,
+        packed: np.ndarray,
+        card_system_key: str = "italian_40",
+        language: str = "it",
+    ) -> "Deck":
+        packed = np.asarray(packed, dtype=np.uint8)
+        n_bytes = (_system_tables(card_system_key).deck_size + 7) // 8
+        if packed.shape != (n_bytes,):
+            raise ValueError(
+                f"Packed state of shape {packed.shape} does not match the {n_bytes} bytes of '{card_system_key}'."
+            )
+        bits = int.from_bytes(packed.tobytes(), "little")
+        return cls.from_bits(bits, card_system_key=card_system_key, language=language)
 
     def copy(self) -> "Deck":
         """
         Retourne une copie superficielle (shallow copy) du Deck.
         Optimisé pour la performance en réutilisant les objets Card immuables.
         """
-        new_deck = Deck(card_system_key=self.card_system_key, language=self.language)
+        new_deck = Deck(
+            card_system_key=self.card_system_key,
+            language=self.language,
+            _state_cache=self._state_cache.copy(),
+        )
         new_deck._cards = self._cards[:]
-        new_deck._card_set = self._card_set.copy()
-        
-        new_deck._state_cache = self._state_cache.copy() if self._state_cache is not None else None
-        new_deck._state_dirty = self._state_dirty
+        new_deck._mask = self._mask
         return new_deck
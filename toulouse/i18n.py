@@ -12,10 +12,16 @@ Structure:
   - Key 3: Card system key (e.g., "italian_40", "spanish_40").
 
 - get_translation(): A function to retrieve the appropriate translation data
-  based on language and card system.
+  based on language and card system. Records for the pairs in TRANSLATIONS are
+  resolved once at import.
+
+- refresh_translations(): Call after editing TRANSLATIONS at runtime so that
+  cached records and memoised card names pick up the change.
 """
 
-from typing import Dict, Any
+import warnings
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Set, Tuple
 
 # Centralized dictionary for all translations
 TRANSLATIONS: Dict[str, Dict[str, Any]] = {
@@ -66,22 +72,76 @@ TRANSLATIONS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def get_translation(language: str, card_system: str) -> Dict[str, Any]:
+# Languages for which the English fallback has already been reported
+_WARNED_LANGUAGES: Set[str] = set()
+
+# Resolved translation records for every (language, card system) pair in TRANSLATIONS
+_RESOLVED: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+
+
+def _resolve(lang_data: Dict[str, Any], card_system: str) -> Mapping[str, Any]:
+    return MappingProxyType({
+        "suits": lang_data["suits"].get(card_system, {}),
+        "values": lang_data["values"].get(card_system, {}),
+        "connector": lang_data["connectors"].get("of", "of"),
+    })
+
+
+def _build_resolved():
+    _RESOLVED.clear()
+    for language, lang_data in TRANSLATIONS.items():
+        for card_system in lang_data["suits"]:
+            _RESOLVED[(language, card_system)] = _resolve(lang_data, card_system)
+
+
+def refresh_translations():
+    """
+    Rebuilds the cached translation records after TRANSLATIONS has been edited.
+
+    New languages are picked up by get_translation without it, but card names
+    already formatted by Card.to_string stay memoised until this is called.
+    """
+    _build_resolved()
+    # Imported here: toulouse.core itself imports this module
+    from toulouse.core import _card_name
+    _card_name.cache_clear()
+
+
+def get_translation(language: str, card_system: str, stacklevel: int = 2) -> Mapping[str, Any]:
     """
     Retrieves translation data for a given language and card system.
 
     Args:
         language: The language code (e.g., "en", "fr").
         card_system: The card system key (e.g., "italian_40").
+        stacklevel: Passed to warnings.warn for the fallback warning; library
+            callers raise it so the warning points at user code.
 
     Returns:
-        A dictionary containing "suits", "values", and "connector" strings.
-        Falls back to English if the requested language is not found.
+        A read-only mapping containing "suits", "values", and "connector" strings.
+        Falls back to English if the requested language is not found; a
+        UserWarning is emitted the first time each unknown language is seen.
     """
-    lang_data = TRANSLATIONS.get(language, TRANSLATIONS["en"])
-    
-    return {
-        "suits": lang_data["suits"].get(card_system, {}),
-        "values": lang_data["values"].get(card_system, {}),
-        "connector": lang_data["connectors"].get("of", "of"),
-    }
+    resolved = _RESOLVED.get((language, card_system))
+    if resolved is not None:
+        return resolved
+    lang_data = TRANSLATIONS.get(language)
+    if lang_data is None:
+        if language not in _WARNED_LANGUAGES:
+            _WARNED_LANGUAGES.add(language)
+            warnings.warn(
+                f"Language '{language}' is not available, falling back to English.",
+                UserWarning,
+                stacklevel=stacklevel,
+            )
+        # Unknown languages share the English record; nothing is stored for them
+        resolved = _RESOLVED.get(("en", card_system))
+        if resolved is not None:
+            return resolved
+        lang_data = TRANSLATIONS["en"]
+    # Pairs missing from the cache (languages added later, systems without
+    # translations) are resolved on the fly
+    return _resolve(lang_data, card_system)
+
+
+_build_resolved()